@@ -1,12 +1,68 @@
 # docusign_client.py
+import hashlib
+import json
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Optional
+import jwt
+import orjson
+import requests
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from docusign_esign import ApiClient
 from docusign_esign.apis import EnvelopesApi
 from docusign_esign.client.api_exception import ApiException
+from map import EnvelopeInput
 
+# listStatusChanges returns at most 1000 envelopes per call. Pages after the
+# first are fetched up to 8 at a time (fewer on small machines), which keeps
+# within the SDK's connection pool.
+STATUS_CHANGES_PAGE_SIZE = 1000
+STATUS_CHANGES_PAGE_WORKERS = min(8, os.cpu_count() or 4)
+# envelope_ids travel in the query string, so lookups by ID are split into
+# batches that keep the URL well under common request-line limits
+ENVELOPE_IDS_PER_REQUEST = 100
+# Concurrent get_envelope calls, and retries when DocuSign answers 429
+DETAIL_FETCH_WORKERS = 16
+RATE_LIMIT_RETRIES = 5
+
+# Logins keyed by (client_id, user_id, demo) -> (api_client, account_id, access_token, expires_at).
+# The lock only guards these dicts. A login in progress is marked by an Event in
+# _login_inflight: concurrent cold requests for that key wait on it and share one
+# token exchange, while cache hits and other keys go ahead.
+_login_cache = {}
+_login_inflight = {}
+_login_lock = threading.Lock()
+# How long a waiting request blocks on another thread's login before re-checking
+LOGIN_WAIT_TIMEOUT_SEC = 30
+# Stop reusing a token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN_SEC = 60
+# A background thread per cached login renews its token this long before expiry,
+# retrying failures with exponential backoff up to the cap
+TOKEN_REFRESH_LEAD_SEC = 300
+TOKEN_REFRESH_MAX_BACKOFF_SEC = 60
+_refresh_threads = {}
+
+# Default-account discovery keyed by (auth_server, user_id) -> (account_id, base_uri, expires_at),
+# least recently used first. A user's default account almost never changes, so
+# one lookup outlives many tokens.
+_account_cache = OrderedDict()
+_account_lock = threading.Lock()
+ACCOUNT_CACHE_TTL_SEC = 6 * 3600
+ACCOUNT_CACHE_MAXSIZE = 128
+
+# Pooled connections to the OAuth host for token requests
+_oauth_session = requests.Session()
+JWT_GRANT_TYPE = "urn:ietf:params:oauth:grant-type:jwt-bearer"
+
+@lru_cache(maxsize=4)
 def _load_private_key_bytes(value: str) -> bytes:
-    """Accept either raw PEM content or filesystem path."""
+    """Accept either raw PEM content or filesystem path (read once per process)."""
     if not value:
         raise RuntimeError("RSA key not provided (env RSA_KEY).")
     if "BEGIN" in value and "PRIVATE KEY" in value:
@@ -16,6 +72,11 @@ def _load_private_key_bytes(value: str) -> bytes:
     with open(value, "rb") as f:
         return f.read()
 
+@lru_cache(maxsize=4)
+def _load_private_key(value: str):
+    """Parse the RSA key once per process."""
+    return load_pem_private_key(_load_private_key_bytes(value), password=None)
+
 def docusign_jwt_login(
     client_id: str,
     impersonated_user_id: str,
@@ -25,108 +86,412 @@ def docusign_jwt_login(
     token_lifetime_sec: int = 3600
 ):
     """Returns: (api_client, account_id, access_token)"""
+    return _jwt_login(client_id, impersonated_user_id, private_key, demo, scopes, token_lifetime_sec)[:3]
+
+def _jwt_login(
+    client_id: str,
+    impersonated_user_id: str,
+    private_key: str,
+    demo: bool,
+    scopes,
+    token_lifetime_sec: int
+):
+    """docusign_jwt_login that also returns the token's expires_in seconds."""
     auth_server = "account-d.docusign.com" if demo else "account.docusign.com"
     
     api_client = ApiClient()
     api_client.set_oauth_host_name(auth_server)
     
-    private_key_bytes = _load_private_key_bytes(private_key)
+    access_token, expires_in = _request_access_token(
+        client_id, impersonated_user_id, auth_server, private_key, scopes, token_lifetime_sec
+    )
+    
+    # Discover default account & base_uri, set api_client.host
+    account_id, base_uri = _discover_account(api_client, access_token, auth_server, impersonated_user_id)
+    api_client.host = base_uri + "/restapi"
+    
+    # Attach bearer token for SDK calls, and ask intermediaries not to cache
+    # responses to bearer-authenticated requests (RFC 6819 5.1)
+    api_client.set_default_header("Authorization", f"Bearer {access_token}")
+    api_client.set_default_header("Cache-Control", "no-store")
+    api_client.set_default_header("Pragma", "no-cache")
+    
+    return api_client, account_id, access_token, expires_in
+
+def _request_access_token(
+    client_id: str,
+    impersonated_user_id: str,
+    auth_server: str,
+    private_key: str,
+    scopes,
+    token_lifetime_sec: int
+):
+    """Exchange a PyJWT-signed assertion for (access_token, expires_in) over the pooled OAuth session."""
+    now = int(time.time())
+    assertion = jwt.encode(
+        {
+            "iss": client_id,
+            "sub": impersonated_user_id,
+            "aud": auth_server,
+            "iat": now,
+            "exp": now + token_lifetime_sec,
+            "scope": " ".join(scopes),
+        },
+        _load_private_key(private_key),
+        algorithm="RS256",
+    )
     
     try:
-        token = api_client.request_jwt_user_token(
-            client_id,
-            impersonated_user_id,
-            auth_server,
-            private_key_bytes,
-            token_lifetime_sec,
-            list(scopes),
+        response = _oauth_session.post(
+            f"https://{auth_server}/oauth/token",
+            data={"grant_type": JWT_GRANT_TYPE, "assertion": assertion},
+            headers={"Cache-Control": "no-store"},
+            timeout=30,
         )
-    except ApiException as e:
+    except requests.RequestException as e:
         raise RuntimeError(f"JWT token request failed: {e}") from e
+    if response.status_code != 200:
+        raise RuntimeError(f"JWT token request failed: {response.status_code} {response.text}")
     
-    access_token = token.access_token
+    # Read the token from the raw body with orjson; the server may grant a
+    # shorter lifetime than requested
+    tok = orjson.loads(response.content)
+    return tok["access_token"], int(tok.get("expires_in", token_lifetime_sec))
+
+def _discover_account(api_client: ApiClient, access_token: str, auth_server: str, impersonated_user_id: str):
+    """Return (account_id, base_uri) of the user's default account, cached for ACCOUNT_CACHE_TTL_SEC."""
+    key = (auth_server, impersonated_user_id)
+    with _account_lock:
+        cached = _account_cache.get(key)
+        if cached and time.monotonic() < cached[2]:
+            _account_cache.move_to_end(key)
+            return cached[:2]
     
-    # Discover default account & base_uri, set api_client.host
     user_info = api_client.get_user_info(access_token)
-    default_acct = next(a for a in user_info.accounts if a.is_default)
-    account_id = default_acct.account_id
-    api_client.host = default_acct.base_uri + "/restapi"
+    # is_default comes back as the string "true" from the userinfo endpoint
+    default_acct = next(filter(lambda a: str(a.is_default).lower() == "true", user_info.accounts or []), None)
+    if default_acct is None:
+        raise RuntimeError(f"No default DocuSign account for user {impersonated_user_id}")
+    account = (default_acct.account_id, default_acct.base_uri)
+    with _account_lock:
+        _account_cache[key] = account + (time.monotonic() + ACCOUNT_CACHE_TTL_SEC,)
+        _account_cache.move_to_end(key)
+        while len(_account_cache) > ACCOUNT_CACHE_MAXSIZE:
+            _account_cache.popitem(last=False)
+    return account
+
+def clear_account_cache():
+    """Forget discovered accounts, e.g. after a user's default account changes."""
+    with _account_lock:
+        _account_cache.clear()
+
+def _token_cache_path(token_cache_dir: str, key) -> str:
+    """Token file for one (client_id, user_id, demo) identity inside token_cache_dir."""
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+    return os.path.join(token_cache_dir, f"token-{digest}.json")
+
+def _load_disk_login(path: str, demo: bool):
+    """Rebuild ((api_client, account_id, access_token), seconds_left) from a token file, or None."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        seconds_left = saved["expires_at"] - time.time()
+        if seconds_left <= 0:
+            return None
+        api_client = ApiClient()
+        api_client.set_oauth_host_name("account-d.docusign.com" if demo else "account.docusign.com")
+        api_client.host = saved["base_uri"] + "/restapi"
+        api_client.set_default_header("Authorization", f"Bearer {saved['access_token']}")
+        api_client.set_default_header("Cache-Control", "no-store")
+        api_client.set_default_header("Pragma", "no-cache")
+        return (api_client, saved["account_id"], saved["access_token"]), seconds_left
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_disk_login(path: str, api_client: ApiClient, account_id: str, access_token: str, seconds_left: float):
+    """Write a login to a user-only (0600) token file; failures only cost the next cold start."""
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({
+                "account_id": account_id,
+                "base_uri": api_client.host[:-len("/restapi")],
+                "access_token": access_token,
+                "expires_at": time.time() + seconds_left,
+            }, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def cached_docusign_jwt_login(
+    client_id: str,
+    impersonated_user_id: str,
+    private_key: str,
+    demo: bool = True,
+    token_lifetime_sec: int = 3600,
+    token_cache_dir: Optional[str] = None
+):
+    """Cached docusign_jwt_login; returns (api_client, account_id, access_token)."""
+    key = (client_id, impersonated_user_id, demo)
+    while True:
+        with _login_lock:
+            cached = _login_cache.get(key)
+            if cached and time.monotonic() < cached[3]:
+                return cached[:3]
+            inflight = _login_inflight.get(key)
+            if inflight is None:
+                inflight = _login_inflight[key] = threading.Event()
+                break
+        # Another request is logging in; use its result (or take over if it failed)
+        inflight.wait(timeout=LOGIN_WAIT_TIMEOUT_SEC)
     
-    # Attach bearer token for SDK calls
-    api_client.set_default_header("Authorization", f"Bearer {access_token}")
+    try:
+        token_path = _token_cache_path(token_cache_dir, key) if token_cache_dir else None
+        restored = _load_disk_login(token_path, demo) if token_path and not cached else None
+        if restored:
+            login, seconds_left = restored
+            expires_at = time.monotonic() + seconds_left
+        else:
+            issued_at = time.monotonic()
+            api_client, account_id, access_token, expires_in = _jwt_login(
+                client_id, impersonated_user_id, private_key, demo, ("signature", "impersonation"), token_lifetime_sec
+            )
+            login = (api_client, account_id, access_token)
+            seconds_left = expires_in - TOKEN_EXPIRY_MARGIN_SEC
+            expires_at = issued_at + seconds_left
+            if token_path:
+                _save_disk_login(token_path, login[0], login[1], login[2], seconds_left)
+        
+        with _login_lock:
+            _login_cache[key] = login + (expires_at,)
+            if key not in _refresh_threads:
+                thread = threading.Thread(
+                    target=_refresh_tokens, args=(key, private_key, token_lifetime_sec, token_path),
+                    name="docusign-token-refresh", daemon=True,
+                )
+                _refresh_threads[key] = thread
+                thread.start()
+        return login
+    finally:
+        with _login_lock:
+            del _login_inflight[key]
+        inflight.set()
+
+def _refresh_tokens(key, private_key: str, token_lifetime_sec: int, token_path: Optional[str] = None):
+    """Background loop that renews the token for `key` on its ApiClient shortly before it expires."""
+    client_id, impersonated_user_id, demo = key
+    auth_server = "account-d.docusign.com" if demo else "account.docusign.com"
+    backoff = 1
+    while True:
+        with _login_lock:
+            api_client, account_id, _, expires_at = _login_cache[key]
+        now = time.monotonic()
+        # Tokens granted for less than the refresh lead are renewed at half-life
+        delay = max(expires_at + TOKEN_EXPIRY_MARGIN_SEC - TOKEN_REFRESH_LEAD_SEC - now, (expires_at - now) / 2)
+        if delay > 0:
+            time.sleep(delay)
+        
+        try:
+            issued_at = time.monotonic()
+            access_token, expires_in = _request_access_token(
+                client_id, impersonated_user_id, auth_server, private_key,
+                ("signature", "impersonation"), token_lifetime_sec,
+            )
+        except Exception:
+            time.sleep(backoff)
+            backoff = min(backoff * 2, TOKEN_REFRESH_MAX_BACKOFF_SEC)
+            continue
+        backoff = 1
+        
+        with _login_lock:
+            # A request may have logged in again while this one was in flight
+            if _login_cache[key][0] is api_client:
+                api_client.set_default_header("Authorization", f"Bearer {access_token}")
+                seconds_left = expires_in - TOKEN_EXPIRY_MARGIN_SEC - (time.monotonic() - issued_at)
+                _login_cache[key] = (api_client, account_id, access_token, time.monotonic() + seconds_left)
+                if token_path:
+                    _save_disk_login(token_path, api_client, account_id, access_token, seconds_left)
+
+@lru_cache(maxsize=4)
+def get_envelopes_api(api_client: ApiClient) -> EnvelopesApi:
+    """One EnvelopesApi per logged-in client; token refreshes reuse the same client, so the wrapper stays valid."""
+    return EnvelopesApi(api_client)
+
+def iter_status_changes_since(envelopes_api: EnvelopesApi, account_id: str, since_date: str):
+    """Yield every envelope changed since the given date, fetching up to STATUS_CHANGES_PAGE_WORKERS pages at a time."""
+    def fetch_page(start_position):
+        return envelopes_api.list_status_changes(
+            account_id,
+            from_date=since_date,
+            include="recipients,custom_fields",
+            count=str(STATUS_CHANGES_PAGE_SIZE),
+            start_position=str(start_position)
+        )
+    
+    first_page = fetch_page(0)
+    yield from first_page.envelopes or ()
+    
+    page_starts = range(STATUS_CHANGES_PAGE_SIZE, int(first_page.total_set_size or 0), STATUS_CHANGES_PAGE_SIZE)
+    if page_starts:
+        workers = min(STATUS_CHANGES_PAGE_WORKERS, len(page_starts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Keep at most `workers` pages in flight so unconsumed pages don't pile up
+            starts = iter(page_starts)
+            pending = deque(pool.submit(fetch_page, start) for start in islice(starts, workers))
+            while pending:
+                page = pending.popleft().result()
+                for start in islice(starts, 1):
+                    pending.append(pool.submit(fetch_page, start))
+                yield from page.envelopes or ()
+
+def list_envelopes_by_ids(envelopes_api: EnvelopesApi, account_id: str, envelope_ids: list,
+                          include: str = "recipients,custom_fields") -> dict:
+    """Look up envelopes in batches with listStatusChanges(envelope_ids=...), keyed by envelope ID."""
+    def fetch_batch(batch):
+        return envelopes_api.list_status_changes(
+            account_id,
+            envelope_ids=",".join(batch),
+            include=include,
+        )
+    
+    batches = [envelope_ids[i:i + ENVELOPE_IDS_PER_REQUEST]
+               for i in range(0, len(envelope_ids), ENVELOPE_IDS_PER_REQUEST)]
+    if not batches:
+        return {}
+    found = {}
+    with ThreadPoolExecutor(max_workers=min(STATUS_CHANGES_PAGE_WORKERS, len(batches))) as pool:
+        for page in pool.map(fetch_batch, batches):
+            for envelope in (page.envelopes or []):
+                found[envelope.envelope_id] = envelope
+    return found
+
+def get_envelopes_by_ids(envelopes_api: EnvelopesApi, account_id: str, envelope_ids: list,
+                         include: str = "recipients,custom_fields") -> list:
+    """Fetch envelopes by ID, batch-listed first with get_envelope for any the listing misses."""
+    try:
+        found = list_envelopes_by_ids(envelopes_api, account_id, envelope_ids, include)
+    except ApiException:
+        found = {}
+    
+    needs_custom_fields = "custom_fields" in include
+    missing_ids = [
+        envelope_id for envelope_id in envelope_ids
+        if envelope_id not in found or (needs_custom_fields and found[envelope_id].custom_fields is None)
+    ]
+    found.update(zip(missing_ids, get_envelopes_concurrently(envelopes_api, account_id, missing_ids, include)))
+    return [found[envelope_id] for envelope_id in envelope_ids]
+
+def envelope_to_input(envelope) -> EnvelopeInput:
+    """Convert an SDK Envelope model to the EnvelopeInput consumed by map.bulk_upsert_envelopes."""
+    custom_fields = envelope.custom_fields
+    recipients = envelope.recipients
+    return EnvelopeInput(
+        envelope_id=envelope.envelope_id,
+        subject=envelope.email_subject,
+        sender_email=getattr(envelope.sender, 'email', None),
+        status=envelope.status,
+        created=envelope.created_date_time,
+        sent=envelope.sent_date_time,
+        delivered=envelope.delivered_date_time,
+        completed=envelope.completed_date_time,
+        text_custom_fields=[
+            {"name": cf.name, "value": cf.value}
+            for cf in (custom_fields.text_custom_fields or [])
+        ] if custom_fields else [],
+        signers=[
+            {
+                "email": r.email,
+                "name": r.name,
+                "status": r.status,
+                "routingOrder": r.routing_order,
+                "roleName": r.role_name
+            }
+            for r in (recipients.signers or [])
+        ] if recipients else [],
+    )
+
+def get_envelope_with_backoff(envelopes_api: EnvelopesApi, account_id: str, envelope_id: str,
+                              include: str = "recipients,custom_fields"):
+    """get_envelope, retrying with exponential backoff while DocuSign rate-limits (HTTP 429)."""
+    delay = 1
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            return envelopes_api.get_envelope(account_id=account_id, envelope_id=envelope_id, include=include)
+        except ApiException as e:
+            if e.status != 429 or attempt == RATE_LIMIT_RETRIES - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+def get_envelopes_concurrently(envelopes_api: EnvelopesApi, account_id: str, envelope_ids: list,
+                               include: str = "recipients,custom_fields") -> list:
+    """Fetch envelopes in parallel, returning each Envelope (or the exception it raised) in input order."""
+    def fetch(envelope_id):
+        try:
+            return get_envelope_with_backoff(envelopes_api, account_id, envelope_id, include)
+        except Exception as e:
+            return e
     
-    return api_client, account_id, access_token
+    if not envelope_ids:
+        return []
+    with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(envelope_ids))) as pool:
+        return list(pool.map(fetch, envelope_ids))
 
 def fetch_envelopes_since(api_client: ApiClient, account_id: str, since_date: str) -> list:
     """Fetch envelopes changed since the given date using listStatusChanges."""
-    envelopes_api = EnvelopesApi(api_client)
+    envelopes_api = get_envelopes_api(api_client)
     
     try:
-        # Use listStatusChanges to get envelopes changed since the given date
-        results = envelopes_api.list_status_changes(
-            account_id, 
-            from_date=since_date,
-            include="recipients,custom_fields"
-        )
-        
+        # Use listStatusChanges to get envelopes changed since the given date.
+        # The list already includes recipients and custom fields, so envelopes
+        # are converted as they arrive; only those that came back without
+        # custom fields keep a slot to be filled by an individual fetch.
         envelope_list = []
-        for envelope in (results.envelopes or []):
-            # Get detailed envelope information
-            detailed_envelope = envelopes_api.get_envelope(
-                account_id=account_id, 
-                envelope_id=envelope.envelope_id,
-                include="recipients,custom_fields"
-            )
-            
-            # Convert to dict format compatible with upsert_envelope
-            envelope_data = {
-                "envelopeId": detailed_envelope.envelope_id,
-                "emailSubject": detailed_envelope.email_subject,
-                "status": detailed_envelope.status,
-                "createdDateTime": detailed_envelope.created_date_time,
-                "sentDateTime": detailed_envelope.sent_date_time,
-                "deliveredDateTime": detailed_envelope.delivered_date_time,
-                "completedDateTime": detailed_envelope.completed_date_time,
-                "sender": {"email": getattr(detailed_envelope.sender, 'email', None)},
-                "customFields": {
-                    "textCustomFields": [
-                        {"name": cf.name, "value": cf.value}
-                        for cf in (detailed_envelope.custom_fields.text_custom_fields or [])
-                    ] if detailed_envelope.custom_fields else []
-                },
-                "recipients": {
-                    "signers": [
-                        {
-                            "email": r.email,
-                            "name": r.name,
-                            "status": r.status,
-                            "routingOrder": str(r.routing_order),
-                            "roleName": r.role_name
-                        }
-                        for r in (detailed_envelope.recipients.signers or [])
-                    ] if detailed_envelope.recipients else []
-                }
-            }
-            envelope_list.append(envelope_data)
+        missing = {}  # position in envelope_list -> envelope_id
+        for envelope in iter_status_changes_since(envelopes_api, account_id, since_date):
+            if envelope.custom_fields is None:
+                missing[len(envelope_list)] = envelope.envelope_id
+                envelope_list.append(None)
+            else:
+                envelope_list.append(envelope_to_input(envelope))
+        
+        detailed = get_envelopes_concurrently(envelopes_api, account_id, list(missing.values()))
+        for position, envelope in zip(missing, detailed):
+            if isinstance(envelope, Exception):
+                raise envelope
+            envelope_list[position] = envelope_to_input(envelope)
         
         return envelope_list
     
     except ApiException as e:
         raise RuntimeError(f"fetch_envelopes_since failed: {e}") from e
 
+def iso_days_ago(days: int) -> str:
+    """The UTC date `days` days back as YYYY-MM-DD, the from_date format listStatusChanges takes."""
+    return (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
+
 def fetch_envelopes(api_client: ApiClient, account_id: str, days_back: int = 30) -> list:
     """Fetch envelopes from the last N days (backward compatibility)."""
-    from_date = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    return fetch_envelopes_since(api_client, account_id, from_date)
+    return fetch_envelopes_since(api_client, account_id, iso_days_ago(days_back))
+
+@lru_cache(maxsize=1)
+def _docusign_settings():
+    """DocuSign settings from the environment, read once."""
+    return (
+        os.getenv("INTEGRATION_KEY"),
+        os.getenv("USER_ID"),
+        os.getenv("RSA_KEY"),
+        os.getenv("DOCUSIGN_DEMO", "true").lower() == "true",
+        os.path.expanduser(os.getenv("DOCUSIGN_TOKEN_CACHE_DIR")) if os.getenv("DOCUSIGN_TOKEN_CACHE_DIR") else None,
+    )
 
 def get_docusign_client():
     """Initialize DocuSign client from environment variables."""
-    client_id = os.getenv("INTEGRATION_KEY")
-    user_id = os.getenv("USER_ID") 
-    rsa_key = os.getenv("RSA_KEY")
-    demo = os.getenv("DOCUSIGN_DEMO", "true").lower() == "true"
+    client_id, user_id, rsa_key, demo, token_cache_dir = _docusign_settings()
     
     if not all([client_id, user_id, rsa_key]):
         raise RuntimeError("Missing DocuSign credentials in environment")
     
-    return docusign_jwt_login(client_id, user_id, rsa_key, demo=demo)
\ No newline at end of file
+    return cached_docusign_jwt_login(client_id, user_id, rsa_key, demo=demo, token_cache_dir=token_cache_dir)
\ No newline at end of file
@@ -1,135 +1,273 @@
 # map.py
+import os
+import re
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
-from models import Envelope, Recipient
+from models import Envelope, Recipient, utc_now
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+# Envelopes per INSERT ... ON DUPLICATE KEY UPDATE batch. The driver folds each
+# executemany into one multi-row statement, so this also bounds the statement
+# size (recipients carry their raw JSON) well under MySQL's max_allowed_packet.
+UPSERT_CHUNK_SIZE = 500
+
+@lru_cache(maxsize=1)
+def store_raw_recipient():
+    """Whether to keep each signer's full DocuSign JSON in recipients.raw (STORE_RAW_RECIPIENT)."""
+    return os.getenv("STORE_RAW_RECIPIENT", "true").lower() == "true"
+
+@dataclass
+class EnvelopeInput:
+    """One DocuSign envelope as flat, slotted fields; signers and text custom fields keep DocuSign's JSON shape."""
+    __slots__ = (
+        "envelope_id", "subject", "sender_email", "status",
+        "created", "sent", "delivered", "completed",
+        "text_custom_fields", "signers",
+    )
+    envelope_id: str
+    subject: Optional[str]
+    sender_email: Optional[str]
+    status: Optional[str]
+    created: Optional[str]
+    sent: Optional[str]
+    delivered: Optional[str]
+    completed: Optional[str]
+    text_custom_fields: list
+    signers: list
 
 def iso2dt(s):
-    return datetime.fromisoformat(s.replace("Z","+00:00")) if s else None
-
-def upsert_envelope(session: Session, item: dict):
-    env_id = item["envelopeId"]
-    env = session.get(Envelope, env_id) or Envelope(id=env_id)
-    env.subject = item.get("emailSubject")
-    env.sender_email = (item.get("sender") or {}).get("email")
-    env.status = (item.get("status") or "").lower()
-    env.created_at = iso2dt(item.get("createdDateTime"))
-    env.sent_at = iso2dt(item.get("sentDateTime"))
-    env.delivered_at = iso2dt(item.get("deliveredDateTime"))
-    env.completed_at = iso2dt(item.get("completedDateTime"))
+    """Parse a DocuSign ISO-8601 timestamp; datetime values pass through unchanged."""
+    if not s:
+        return None
+    if isinstance(s, datetime):
+        return s
+    return parse_iso_timestamp(s)
+
+@lru_cache(maxsize=256)
+def parse_iso_timestamp(s: str) -> datetime:
+    """Memoized ISO-8601 parse; timestamps repeat within an envelope and across a batch."""
+    return datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+
+# Configuration: Map custom field names to their deal name meanings
+# Update these mappings based on your DocuSign template configuration
+DEAL_NAME_FIELD_MAPPINGS = {
+    # Traditional deal name fields
+    "deal": "direct_value",
+    "deal_name": "direct_value", 
+    "dealname": "direct_value",
+    
+    # Custom field that might contain Initial Value for deal name
+    "custom field": "direct_value",
+    
+    # Field that contains deal categorization
+    "envelopetypes": "category_value",
+    
+    # Add more mappings here as you discover them
+    # "your_field_name": "direct_value",
+}
+
+# Direct company matches; plain literals, so ASCII subjects are checked with
+# str.find instead of the first regex below
+DEAL_NAME_COMPANIES = ("Angiex", "Vision", "Morgan Mutual", "AXOS", "STRATA")
+
+# Patterns to extract deal names from subjects, tried in order. Compiled once at
+# import instead of going through re's pattern cache for every envelope. Each
+# pattern carries the lowercase literal an ASCII subject must contain for it to
+# match (None if there is none), so the regex is skipped when the literal is absent.
+DEAL_NAME_SUBJECT_PATTERNS = tuple((gate, re.compile(p, re.IGNORECASE)) for gate, p in (
+    # Direct company matches
+    (None, "(" + "|".join(DEAL_NAME_COMPANIES) + ")"),
+    
+    # Company names with underscores (like STRATA_Trust)
+    (None, r'([A-Z][A-Z_a-z\s]{3,25}?)(?:_(?:Trust|IRA|Distribution))'),
+    
+    # Company names followed by common document types
+    (None, r'([A-Z][a-zA-Z\s]{2,20})(?:\s+(?:Subscription|Consent|Investment|Account|Distribution|Agreement|NAF))'),
+    
+    # Extract from "Complete with Docusign: Company Name"
+    ("complete with docusign:", r'Complete with Docusign:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Subscription|Consent|Agreement))'),
+    
+    # Extract from "Name: Company Action" format
+    (None, r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Subscription|Consent|Account|Distribution|Investment|Form|Agreement))'),
+    
+    # Extract from "FINAL APPROVAL: Company / Name" format  
+    ("final approval:", r'FINAL APPROVAL:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*/)'),
+    
+    # Extract from "Please DocuSign: Company Name"
+    ("please docusign:", r'Please DocuSign:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Account|Form))'),
+))
+
+# All subject patterns fused into one alternation. A single scan tells whether
+# any pattern can match; most subjects that match nothing stop there. The
+# ordered patterns still decide which capture wins, since one alternation
+# would prefer the leftmost match rather than the highest-priority pattern.
+DEAL_NAME_SUBJECT_ANY = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for _, pattern in DEAL_NAME_SUBJECT_PATTERNS),
+    re.IGNORECASE,
+)
 
+# Subject-line captures that are boilerplate rather than a deal name
+DEAL_NAME_STOP_WORDS = frozenset({'complete', 'docusign', 'with'})
+
+def extract_deal_name(envelope: EnvelopeInput):
+    """Extract the deal name from custom fields, falling back to subject-line patterns."""
     # deal_name from customFields (textCustomFields) or from your app's metadata
     deal_name = None
-    cf = item.get("customFields") or {}
-    
-    # Configuration: Map custom field names to their deal name meanings
-    # Update these mappings based on your DocuSign template configuration
-    DEAL_NAME_FIELD_MAPPINGS = {
-        # Traditional deal name fields
-        "deal": "direct_value",
-        "deal_name": "direct_value", 
-        "dealname": "direct_value",
-        
-        # Custom field that might contain Initial Value for deal name
-        "custom field": "direct_value",
-        
-        # Field that contains deal categorization
-        "envelopetypes": "category_value",
-        
-        # Add more mappings here as you discover them
-        # "your_field_name": "direct_value",
-    }
     
-    for t in (cf.get("textCustomFields") or []):
-        field_name = t.get("name","").lower()
-        field_value = t.get("value","").strip()
-        
-        # Check if this field is configured for deal name mapping
-        if field_name in DEAL_NAME_FIELD_MAPPINGS and field_value:
-            mapping_type = DEAL_NAME_FIELD_MAPPINGS[field_name]
-            
-            if mapping_type == "direct_value":
-                # Use the field value directly as deal name
-                deal_name = field_value
-                break
-            elif mapping_type == "category_value":
-                # Use as categorization (like envelopeTypes)
-                deal_name = field_value
-                break
+    for t in envelope.text_custom_fields:
+        # Only fields configured for deal name mapping need their value read.
+        # Both mapping types ("direct_value" and "category_value", like
+        # envelopeTypes) use the field value as the deal name.
+        if (t.get("name") or "").lower() not in DEAL_NAME_FIELD_MAPPINGS:
+            continue
+        field_value = (t.get("value") or "").strip()
+        if field_value:
+            deal_name = field_value
+            break
     
     # If no custom field deal name found, try to extract from subject line
     if not deal_name:
-        subject = item.get("emailSubject", "") or ""
-        # Look for common patterns in subjects like "Company Name" followed by specific indicators
-        import re
-        
-        # Pattern to extract deal names from subjects
-        patterns = [
-            # Direct company matches
-            r'(Angiex|Vision|Morgan Mutual|AXOS|STRATA)',
-            
-            # Company names with underscores (like STRATA_Trust)
-            r'([A-Z][A-Z_a-z\s]{3,25}?)(?:_(?:Trust|IRA|Distribution))',
-            
-            # Company names followed by common document types
-            r'([A-Z][a-zA-Z\s]{2,20})(?:\s+(?:Subscription|Consent|Investment|Account|Distribution|Agreement|NAF))',
-            
-            # Extract from "Complete with Docusign: Company Name"
-            r'Complete with Docusign:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Subscription|Consent|Agreement))',
-            
-            # Extract from "Name: Company Action" format
-            r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Subscription|Consent|Account|Distribution|Investment|Form|Agreement))',
-            
-            # Extract from "FINAL APPROVAL: Company / Name" format  
-            r'FINAL APPROVAL:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*/)',
-            
-            # Extract from "Please DocuSign: Company Name"
-            r'Please DocuSign:\s*([A-Z][a-zA-Z\s]{2,20}?)(?:\s*(?:Account|Form))',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, subject, re.IGNORECASE)
-            if match:
-                potential_deal = match.group(1).strip()
-                if len(potential_deal) > 2 and not potential_deal.lower() in {'complete', 'docusign', 'with'}:
-                    deal_name = potential_deal
-                    break
+        deal_name = deal_name_from_subject(envelope.subject or "")
     
-    env.deal_name = deal_name
+    return deal_name
 
-    # recipients
-    recs = (item.get("recipients") or {}).get("signers") or []
-    env.recipients.clear()
-    for r in recs:
-        env.recipients.append(Recipient(
-            name=r.get("name"),
-            email=r.get("email"),
-            role=r.get("roleName"),
-            routing_order=int(r.get("routingOrder") or 9999),
-            recipient_status=(r.get("status") or "").lower(),
-            raw=r
-        ))
-
-    env.app_status = derive_app_status(env.status, recs)
-    env.updated_at = datetime.utcnow()
-    session.merge(env)
-
-def derive_app_status(env_status: str, recipients: list) -> str:
-    """Derive application-specific status from DocuSign envelope status and recipients."""
-    if env_status == "voided":
-        return "Cancelled"
-    elif env_status == "declined":
-        return "Declined"
-    elif env_status == "completed":
-        return "Completed"
-    elif env_status in ("sent", "delivered"):
+@lru_cache(maxsize=4096)
+def deal_name_from_subject(subject: str):
+    """Extract a deal name from a subject line (memoized; template subjects repeat)."""
+    # For ASCII text, lower() agrees with IGNORECASE matching, so literal
+    # checks can stand in for the regex engine. Other subjects take the
+    # regex-only path.
+    lowered = subject.lower() if subject.isascii() else None
+    patterns = DEAL_NAME_SUBJECT_PATTERNS
+    if lowered is not None:
+        company = find_company(subject, lowered)
+        if company:
+            return company
+        patterns = patterns[1:]
+    
+    # Look for common patterns in subjects like "Company Name" followed by specific indicators
+    if not DEAL_NAME_SUBJECT_ANY.search(subject):
+        return None
+    for gate, pattern in patterns:
+        if gate and lowered is not None and gate not in lowered:
+            continue
+        match = pattern.search(subject)
+        if match:
+            potential_deal = match.group(1).strip()
+            if len(potential_deal) > 2 and potential_deal.lower() not in DEAL_NAME_STOP_WORDS:
+                return potential_deal
+    return None
+
+def find_company(subject: str, lowered: str):
+    """Leftmost DEAL_NAME_COMPANIES occurrence in an ASCII subject, as written there."""
+    best = None
+    for company in DEAL_NAME_COMPANIES:
+        idx = lowered.find(company.lower())
+        if idx >= 0 and (best is None or idx < best[0]):
+            best = (idx, len(company))
+    if best is None:
+        return None
+    return subject[best[0]:best[0] + best[1]]
+
+# Envelope statuses whose app status doesn't depend on the signers
+ENVELOPE_STATUS_APP_STATUS = {
+    "voided": "Cancelled",
+    "declined": "Declined",
+    "completed": "Completed",
+}
+# Statuses still out for signature, split by how many signers are done
+IN_PROGRESS_STATUSES = frozenset({"sent", "delivered"})
+
+def derive_app_status(env_status: str, signed: int, total: int) -> str:
+    """Derive application-specific status from DocuSign envelope status and signer counts."""
+    app_status = ENVELOPE_STATUS_APP_STATUS.get(env_status)
+    if app_status:
+        return app_status
+    if env_status in IN_PROGRESS_STATUSES:
         # Check if any recipients have signed
-        signed_count = sum(1 for r in recipients if r.get("status", "").lower() == "completed")
-        total_signers = len(recipients)
-        if signed_count == 0:
+        if signed == 0:
             return "Awaiting Customer"
-        elif signed_count < total_signers:
+        elif signed < total:
             return "Partially Signed"
         else:
             return "Awaiting Processing"
-    else:
-        return "Draft"
+    return "Draft"
+
+def envelope_rows(envelope: EnvelopeInput, now: datetime = None):
+    """Flatten an envelope into its `envelopes` row (stamped with `now`) and `recipients` rows."""
+    env_id = envelope.envelope_id
+    recs = envelope.signers
+    rec_rows = []
+    signed = 0
+    store_raw = store_raw_recipient()
+    # Method lookups bound once for the per-signer loop
+    get = dict.get
+    lower = str.lower
+    append = rec_rows.append
+    for r in recs:
+        recipient_status = lower(get(r, "status") or "")
+        signed += recipient_status == "completed"
+        # The SDK gives routing order as a numeric string, or None when unset
+        routing_order = get(r, "routingOrder")
+        routing_order = 9999 if routing_order is None or routing_order == "" else int(routing_order)
+        append({
+            "envelope_id": env_id,
+            "name": get(r, "name"),
+            "email": get(r, "email"),
+            "role": get(r, "roleName"),
+            "routing_order": routing_order,
+            "recipient_status": recipient_status,
+            "raw": r if store_raw else None,
+        })
+    status = (envelope.status or "").lower()
+    env_row = {
+        "id": env_id,
+        "subject": envelope.subject,
+        "sender_email": envelope.sender_email,
+        "deal_name": extract_deal_name(envelope),
+        "status": status,
+        "app_status": derive_app_status(status, signed, len(recs)),
+        "created_at": iso2dt(envelope.created),
+        "sent_at": iso2dt(envelope.sent),
+        "delivered_at": iso2dt(envelope.delivered),
+        "completed_at": iso2dt(envelope.completed),
+        "updated_at": now or utc_now(),
+    }
+    return env_row, rec_rows
+
+@lru_cache(maxsize=4)
+def envelope_upsert_statement(dialect_name: str):
+    """INSERT ... ON DUPLICATE KEY UPDATE into envelopes, updating every non-key column."""
+    if dialect_name != "mysql":
+        raise RuntimeError(f"Envelope upserts require MySQL, not {dialect_name}")
+    stmt = mysql_insert(Envelope)
+    return stmt.on_duplicate_key_update(
+        {c.name: stmt.inserted[c.name] for c in Envelope.__table__.columns if c.name != "id"}
+    )
+
+def bulk_upsert_envelopes(session: Session, envelopes: list):
+    """Upsert envelopes in chunks, replacing each chunk's recipients with one DELETE and one INSERT."""
+    stmt = envelope_upsert_statement(session.get_bind().dialect.name)
+
+    # An envelope listed twice (e.g. across concurrently fetched pages) would
+    # insert its recipients twice; keep the last copy of each
+    envelopes = list({envelope.envelope_id: envelope for envelope in envelopes}.values())
+
+    now = utc_now()
+    for start in range(0, len(envelopes), UPSERT_CHUNK_SIZE):
+        chunk = envelopes[start:start + UPSERT_CHUNK_SIZE]
+        env_rows = []
+        rec_rows = []
+        for envelope in chunk:
+            env_row, envelope_rec_rows = envelope_rows(envelope, now)
+            env_rows.append(env_row)
+            rec_rows.extend(envelope_rec_rows)
+
+        session.execute(stmt, env_rows)
+        session.execute(delete(Recipient).where(Recipient.envelope_id.in_([row["id"] for row in env_rows])))
+        if rec_rows:
+            session.execute(insert(Recipient), rec_rows)
@@ -1,10 +1,14 @@
 # models.py
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, JSON, Index
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, JSON, Index, inspect, text
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
+def utc_now():
+    """Current UTC time as a naive datetime, matching the naive DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 EnvelopeStatus = Enum("created","sent","delivered","completed","declined","voided","processing",
                       name="envelope_status")
 
@@ -14,17 +18,30 @@ class Envelope(Base):
     subject = Column(String(255))
     sender_email = Column(String(255))
     deal_name = Column(String(255))                  # from a custom field you choose
-    status = Column(EnvelopeStatus, index=True)      # raw DocuSign status
-    app_status = Column(String(64), index=True)      # your derived status ("Awaiting Customer", etc.)
+    status = Column(EnvelopeStatus)                  # raw DocuSign status
+    app_status = Column(String(64))                  # your derived status ("Awaiting Customer", etc.)
     created_at = Column(DateTime)
     sent_at = Column(DateTime)
     delivered_at = Column(DateTime)
     completed_at = Column(DateTime)
-    updated_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=utc_now)
 
     recipients = relationship("Recipient", back_populates="envelope", cascade="all, delete-orphan")
 
-Index("idx_envelopes_deal_status", Envelope.deal_name, Envelope.app_status)
+# Per-deal listings filtered by app status come back newest first without a filesort
+Index("idx_envelopes_deal_status_updated", Envelope.deal_name, Envelope.app_status, Envelope.updated_at.desc())
+# Match /envelopes filters + ORDER BY updated_at DESC so the LIMIT stops early
+Index("idx_envelopes_updated", Envelope.updated_at.desc())
+Index("idx_envelopes_status_updated", Envelope.status, Envelope.updated_at.desc())
+Index("idx_envelopes_app_status_updated", Envelope.app_status, Envelope.updated_at.desc())
+# Also serves refresh-deal-names: WHERE deal_name IS NULL ORDER BY updated_at DESC
+Index("idx_envelopes_deal_updated", Envelope.deal_name, Envelope.updated_at.desc())
+# Range scans for the /envelopes date_field filters
+Index("idx_envelopes_created_at", Envelope.created_at)
+Index("idx_envelopes_sent_at", Envelope.sent_at)
+Index("idx_envelopes_completed_at", Envelope.completed_at)
+# Backs the /envelopes search box (MATCH ... AGAINST)
+Index("ft_envelopes_search", Envelope.deal_name, Envelope.subject, Envelope.sender_email, mysql_prefix="FULLTEXT")
 
 class Recipient(Base):
     __tablename__ = "recipients"
@@ -35,16 +52,41 @@ class Recipient(Base):
     role = Column(String(64))
     routing_order = Column(Integer)
     recipient_status = Column(String(64))            # sent, delivered, completed, declined, etc.
-    raw = Column(JSON)                               # optional: full recipient JSON
+    raw = Column(JSON(none_as_null=True))            # optional: full recipient JSON
 
     envelope = relationship("Envelope", back_populates="recipients")
 
+# Recipient lookups and the sync's DELETE ... WHERE envelope_id IN (...). InnoDB
+# would otherwise only have the implicit FK index, which other backends lack.
+Index("idx_recipients_envelope", Recipient.envelope_id)
+
 class SyncLog(Base):
     __tablename__ = "sync_logs"
     id = Column(Integer, primary_key=True, autoincrement=True)
     sync_type = Column(String(50), default="envelope_sync")  # Allow different sync types
-    last_sync_date = Column(DateTime, default=datetime.utcnow)
+    last_sync_date = Column(DateTime, default=utc_now)
     envelopes_synced = Column(Integer, default=0)
     sync_status = Column(String(20), default="success")  # success, error, partial
     error_message = Column(String(500))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+
+Index("idx_sync_logs_type_status_date", SyncLog.sync_type, SyncLog.sync_status, SyncLog.last_sync_date)
+
+# Indexes older versions created that are now prefixes of the composites above;
+# they only add write cost to every upsert
+OBSOLETE_INDEXES = {
+    "envelopes": ("idx_envelopes_deal_status", "ix_envelopes_status", "ix_envelopes_app_status"),
+}
+
+def create_missing_indexes(engine):
+    """Create indexes added after a table already existed (create_all skips those tables); drop replaced ones."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name, index_names in OBSOLETE_INDEXES.items():
+            existing = {index["name"] for index in inspector.get_indexes(table_name)}
+            for name in index_names:
+                if name in existing:
+                    conn.execute(text(f"DROP INDEX {name} ON {table_name}"))
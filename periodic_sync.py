@@ -9,6 +9,21 @@ import os
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session for every request this script makes. Connection errors and
+# gateway errors from a restarting server are retried with backoff. Status
+# retries only apply to idempotent methods, so the sync POST is never repeated
+# once the server has answered.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 def run_sync(base_url="http://localhost:5000", timeout=300):
     """Run envelope sync and return results."""
@@ -16,7 +31,7 @@ def run_sync(base_url="http://localhost:5000", timeout=300):
         print(f"[{datetime.now()}] Starting envelope sync...")
         
         # Make sync request (incremental sync by default)
-        response = requests.post(
+        response = _SESSION.post(
             f"{base_url}/sync/envelopes",
             json={},  # Empty payload = incremental sync
             timeout=timeout
@@ -49,7 +64,7 @@ def run_sync(base_url="http://localhost:5000", timeout=300):
 def get_sync_status(base_url="http://localhost:5000"):
     """Get current sync status."""
     try:
-        response = requests.get(f"{base_url}/sync/status", timeout=30)
+        response = _SESSION.get(f"{base_url}/sync/status", timeout=30)
         if response.status_code == 200:
             data = response.json()
             last_sync = data.get("last_sync")
@@ -6,19 +6,45 @@ import requests
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    decode_json = orjson.loads
+except ImportError:  # orjson is optional here; fall back to the stdlib parser
+    decode_json = json.loads
 
 def test_api_endpoints(base_url="http://127.0.0.1:5000"):
     """Test the Flask API endpoints."""
+    # One keep-alive session for every probe instead of a new connection per call
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    try:
+        return check_endpoints(session, base_url)
+    finally:
+        session.close()
+
+def check_endpoints(session, base_url):
+    """Probe each endpoint over the given session."""
     print("Testing DocuSign Flask API Integration...")
     
+    # Tests 1 and 2 are read-only and independent, so both requests go out at
+    # once; results are still reported in order. The sync status check waits
+    # for the sync in test 3, which it reports on.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        envelopes_future = pool.submit(session.get, f"{base_url}/envelopes")
+        stats_future = pool.submit(session.get, f"{base_url}/envelopes/stats")
+    
     # Test 1: Get envelopes (should return empty initially)
     print("\n1. Testing GET /envelopes")
     try:
-        response = requests.get(f"{base_url}/envelopes")
+        response = envelopes_future.result()
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response.content)
             print(f"   Found {len(data)} envelopes")
         else:
             print(f"   Error: {response.text}")
@@ -29,10 +55,10 @@ def test_api_endpoints(base_url="http://127.0.0.1:5000"):
     # Test 2: Get stats
     print("\n2. Testing GET /envelopes/stats")
     try:
-        response = requests.get(f"{base_url}/envelopes/stats")
+        response = stats_future.result()
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response.content)
             print(f"   Total envelopes: {data.get('total_envelopes', 0)}")
         else:
             print(f"   Error: {response.text}")
@@ -42,11 +68,11 @@ def test_api_endpoints(base_url="http://127.0.0.1:5000"):
     # Test 3: Sync envelopes (requires DocuSign credentials)
     print("\n3. Testing POST /sync/envelopes")
     try:
-        response = requests.post(f"{base_url}/sync/envelopes", 
-                               json={"days_back": 7})
+        response = session.post(f"{base_url}/sync/envelopes", 
+                              json={"days_back": 7})
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response.content)
             print(f"   Sync result: {data.get('message', 'Success')}")
             print(f"   Synced count: {data.get('synced_count', 0)}")
         else:
@@ -57,10 +83,10 @@ def test_api_endpoints(base_url="http://127.0.0.1:5000"):
     # Test 4: Test sync status endpoint
     print("\n4. Testing GET /sync/status")
     try:
-        response = requests.get(f"{base_url}/sync/status")
+        response = session.get(f"{base_url}/sync/status")
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response.content)
             last_sync = data.get("last_sync")
             if last_sync:
                 print(f"   Last sync: {last_sync.get('date')} ({last_sync.get('status')})")
@@ -75,11 +101,11 @@ def test_api_endpoints(base_url="http://127.0.0.1:5000"):
     # Test 5: Test incremental sync (no parameters = incremental)
     print("\n5. Testing POST /sync/envelopes (incremental)")
     try:
-        response = requests.post(f"{base_url}/sync/envelopes", 
-                               json={})  # Empty payload = incremental sync
+        response = session.post(f"{base_url}/sync/envelopes", 
+                              json={})  # Empty payload = incremental sync
         print(f"   Status: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response.content)
             print(f"   Sync result: {data.get('message', 'Success')}")
             print(f"   Synced count: {data.get('synced_count', 0)}")
         else: